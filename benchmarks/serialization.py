@@ -0,0 +1,72 @@
+"""
+Микробенчмарк сериализации списка сайтов.
+
+Сравнивает стандартный путь FastAPI (модели -> dict -> повторная валидация по
+response_model -> JSON) с PydanticJSONResponse на заранее собранном TypeAdapter.
+
+Запуск из корня репозитория (нужен заполненный .env, как и для самого приложения):
+
+    uv run python -m benchmarks.serialization
+"""
+
+import asyncio
+import timeit
+from datetime import datetime
+from functools import partial
+
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.core.responses import PydanticJSONResponse
+from src.routers.frontend.sites.schemas import SITE_LIST_ADAPTER, SiteListResponse, SiteResponse
+
+LIST_SIZES = (1, 10, 100, 1_000, 10_000)
+MIN_TOTAL_SITES = 50_000
+
+
+def build_sites_payload(size: int) -> dict[str, list[SiteResponse]]:
+    created_at = datetime(2025, 6, 15, 18, 29, 56)
+    return {
+        "sites": [
+            SiteResponse(
+                id=site_id,
+                title=f"Сайт {site_id}",
+                prompt="Сайт любителей играть в домино",
+                screenshot_url=f"http://example.com/media/{site_id}.png",
+                html_code_url=f"http://example.com/media/{site_id}.html",
+                html_code_download_url=f"http://example.com/media/{site_id}.html?download=1",
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            for site_id in range(1, size + 1)
+        ],
+    }
+
+
+def main() -> None:
+    response_field = create_model_field(name="Response_get_sites_my", type_=SiteListResponse, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def render_default(payload: dict[str, list[SiteResponse]]) -> bytes:
+        content = loop.run_until_complete(serialize_response(field=response_field, response_content=payload))
+        return ORJSONResponse(content).body
+
+    def render_fast(payload: dict[str, list[SiteResponse]]) -> bytes:
+        return PydanticJSONResponse(payload, SITE_LIST_ADAPTER).body
+
+    print(f"{'sites':>8} {'default, ms':>12} {'fast, ms':>10} {'speedup':>8}")
+    for size in LIST_SIZES:
+        payload = build_sites_payload(size)
+        assert render_default(payload) == render_fast(payload)
+
+        number = max(1, MIN_TOTAL_SITES // size)
+        default_time = min(timeit.repeat(partial(render_default, payload), number=number, repeat=3)) / number
+        fast_time = min(timeit.repeat(partial(render_fast, payload), number=number, repeat=3)) / number
+        print(f"{size:>8} {default_time * 1000:>12.3f} {fast_time * 1000:>10.3f} {default_time / fast_time:>7.1f}x")
+
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -138,6 +138,134 @@ class UnsplashSettings(BaseModel):
     )
 
 
+class GenerationSettings(BaseModel):
+    """Site generation settings"""
+
+    buffer_max_memory_size: int = Field(
+        default=1024 * 1024,
+        description="Размер сгенерированного HTML в байтах, после которого буфер сбрасывается на диск",
+        ge=1,
+    )
+    batch_concurrency: int = Field(
+        default=4,
+        description="Сколько сайтов из одного пакета генерируется одновременно",
+        ge=1,
+    )
+    batch_max_size: int = Field(
+        default=100,
+        description="Максимальное количество промптов в одном пакете",
+        ge=1,
+    )
+    disconnect_abort_threshold: int = Field(
+        default=0,
+        description="Сколько байт HTML должно быть сгенерировано, чтобы при отключении клиента генерация "
+        "продолжилась в фоне, а не прервалась",
+        ge=0,
+    )
+    stream_queue_size: int = Field(
+        default=64,
+        description="Сколько чанков HTML может ждать отправки клиенту, прежде чем генерация приостановится",
+        ge=1,
+    )
+    shutdown_timeout: float = Field(
+        default=30,
+        description="Сколько секунд при остановке приложения ждать генерации, дорабатывающие в фоне",
+        gt=0,
+    )
+
+
+class ProfilingSettings(BaseModel):
+    """Request profiling settings"""
+
+    enabled: bool = Field(
+        default=False,
+        description="Включить профилирование запросов",
+    )
+    sample_rate: float = Field(
+        default=0.0,
+        description="Доля случайно профилируемых запросов",
+        ge=0,
+        le=1,
+    )
+    secret: SecretStr | None = Field(
+        default=None,
+        description="Секрет для подписи заголовка X-Profile-Signature",
+    )
+    interval: float = Field(
+        default=0.001,
+        description="Интервал семплирования профайлера в секундах",
+        gt=0,
+    )
+    max_duration: float = Field(
+        default=60,
+        description="Максимальная длительность профилирования одного запроса в секундах",
+        gt=0,
+    )
+    signature_ttl: int = Field(
+        default=300,
+        description="Сколько секунд подпись X-Profile-Signature остаётся действительной",
+        ge=1,
+    )
+    path_prefix: str = Field(
+        default="/frontend-api/",
+        description="Префикс пути запросов, которые можно профилировать",
+    )
+    storage_prefix: str = Field(
+        default="profiles/",
+        description="Префикс имён файлов профилей в хранилище",
+    )
+    max_recent: int = Field(
+        default=50,
+        description="Сколько последних профилей показывать в админке",
+        ge=1,
+    )
+
+
+class LoopMonitorSettings(BaseModel):
+    """Event loop lag monitor settings"""
+
+    enabled: bool = Field(
+        default=True,
+        description="Включить мониторинг задержки event loop",
+    )
+    interval: float = Field(
+        default=0.1,
+        description="Интервал замера задержки event loop в секундах",
+        gt=0,
+    )
+    stack_dump_threshold: float = Field(
+        default=0.5,
+        description="Задержка event loop в секундах, после которой в лог пишется стек блокирующего кода",
+        gt=0,
+    )
+    shed_threshold: float | None = Field(
+        default=None,
+        description="Сглаженная задержка event loop в секундах, после которой новые генерации отклоняются с 503",
+        gt=0,
+    )
+    smoothing: float = Field(
+        default=0.2,
+        description="Вес нового замера в экспоненциальном сглаживании задержки event loop",
+        gt=0,
+        le=1,
+    )
+
+
+class SiteEventsSettings(BaseModel):
+    """Site generation events settings"""
+
+    queue_size: int = Field(
+        default=100,
+        description="Максимальное количество непрочитанных событий на одного подписчика",
+        ge=1,
+    )
+    keepalive_interval: float = Field(
+        default=15,
+        description="Интервал отправки keepalive-комментариев в потоке событий в секундах",
+        gt=0,
+    )
+
+
 class AppSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -153,6 +281,10 @@ class AppSettings(BaseSettings):
     deepseek: DeepSeekSettings
     s3: S3Settings
     gotenberg: GotenbergSettings
+    generation: GenerationSettings = GenerationSettings()
+    profiling: ProfilingSettings = ProfilingSettings()
+    loop_monitor: LoopMonitorSettings = LoopMonitorSettings()
+    site_events: SiteEventsSettings = SiteEventsSettings()
     debug: bool = False
 
 
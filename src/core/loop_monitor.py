@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+from .config import LoopMonitorSettings
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """Фоновый монитор задержки планирования event loop."""
+
+    def __init__(self, settings: LoopMonitorSettings) -> None:
+        self.settings = settings
+        self.lag = 0.0
+        self.smoothed_lag = 0.0
+        self.max_lag = 0.0
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: int | None = None
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    async def __aenter__(self) -> "LoopLagMonitor":
+        if not self.settings.enabled:
+            return self
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._measure())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog:
+            self._watchdog.join(timeout=self.settings.interval * 2)
+            self._watchdog = None
+
+    @property
+    def is_overloaded(self) -> bool:
+        """Превышает ли сглаженный лаг порог, после которого новые генерации отклоняются."""
+        threshold = self.settings.shed_threshold
+        return threshold is not None and self.smoothed_lag > threshold
+
+    async def _measure(self) -> None:
+        interval = self.settings.interval
+        while True:
+            started_at = time.monotonic()
+            await asyncio.sleep(interval)
+            self._heartbeat = time.monotonic()
+            self.lag = max(0.0, self._heartbeat - started_at - interval)
+            self.smoothed_lag += self.settings.smoothing * (self.lag - self.smoothed_lag)
+            self.max_lag = max(self.max_lag, self.lag)
+            if self.lag > self.settings.stack_dump_threshold:
+                logger.warning("Event loop lag %.3f s", self.lag)
+
+    def _watch(self) -> None:
+        reported_heartbeat = None
+        while not self._stopped.wait(self.settings.interval):
+            heartbeat = self._heartbeat
+            stalled_for = time.monotonic() - heartbeat - self.settings.interval
+            if stalled_for <= self.settings.stack_dump_threshold or heartbeat == reported_heartbeat:
+                continue
+            reported_heartbeat = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id or 0)
+            if frame is None:
+                continue
+            logger.warning(
+                "Event loop заблокирован %.3f s, стек потока loop:\n%s",
+                stalled_for,
+                "".join(traceback.format_stack(frame)),
+            )
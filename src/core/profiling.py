@@ -0,0 +1,169 @@
+import asyncio
+import contextvars
+import hashlib
+import hmac
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import ProfilingSettings
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SIGNATURE_HEADER = "X-Profile-Signature"
+PROFILE_TIMESTAMP_HEADER = "X-Profile-Timestamp"
+
+
+@dataclass(frozen=True)
+class ProfileRecord:
+    """Сведения о сохранённом профиле запроса."""
+
+    id: str
+    method: str
+    path: str
+    duration: float
+    url: str
+    created_at: datetime
+
+
+class ProfileRegistry:
+    """Список последних сохранённых профилей, хранится в памяти процесса."""
+
+    def __init__(self, max_size: int) -> None:
+        self._records: deque[ProfileRecord] = deque(maxlen=max_size)
+
+    def add(self, record: ProfileRecord) -> None:
+        self._records.appendleft(record)
+
+    def list_recent(self) -> list[ProfileRecord]:
+        return list(self._records)
+
+
+def sign_profile_request(secret: str, timestamp: str, method: str, path: str) -> str:
+    """Подпись запроса для заголовка X-Profile-Signature: HMAC-SHA256 от "timestamp:METHOD:path"."""
+    message = f"{timestamp}:{method.upper()}:{path}".encode()
+    return hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+
+
+def is_profile_signature_valid(
+    settings: ProfilingSettings,
+    method: str,
+    path: str,
+    timestamp: str | None,
+    signature: str | None,
+) -> bool:
+    if not signature or not timestamp or settings.secret is None or not settings.secret.get_secret_value():
+        return False
+    try:
+        signed_at = int(timestamp)
+    except ValueError:
+        return False
+    if abs(time.time() - signed_at) > settings.signature_ttl:
+        return False
+    expected = sign_profile_request(settings.secret.get_secret_value(), timestamp, method, path)
+    return hmac.compare_digest(expected, signature)
+
+
+class _RequestProfiler:
+    """Профайлер одного запроса, привязанный к контексту задачи, в которой выполняется запрос."""
+
+    def __init__(self, settings: ProfilingSettings) -> None:
+        # В async-режиме pyinstrument хранит активный профайлер в contextvar, поэтому запускать
+        # и останавливать его нужно в том же контексте, а не в контексте колбэка или дочерней задачи.
+        self.context = contextvars.copy_context()
+        self.profiler = Profiler(interval=settings.interval, async_mode="enabled")
+        self.is_event_stream = False
+
+    def start(self) -> None:
+        self.context.run(self.profiler.start)
+
+    def stop(self) -> None:
+        if self.profiler.is_running:
+            self.context.run(self.profiler.stop)
+
+    def wrap_send(self, send: Send) -> Send:
+        async def send_and_skip_event_streams(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                content_type = Headers(raw=message["headers"]).get("content-type", "")
+                if content_type.startswith("text/event-stream"):
+                    self.is_event_stream = True
+                    asyncio.get_running_loop().call_soon(self.stop)
+            await send(message)
+
+        return send_and_skip_event_streams
+
+
+class ProfilingMiddleware:
+    """ASGI middleware, которое профилирует часть запросов семплирующим профайлером."""
+
+    def __init__(self, app: ASGIApp, settings: ProfilingSettings) -> None:
+        self.app = app
+        self.settings = settings
+
+    def _should_profile(self, scope: Scope) -> bool:
+        if scope["type"] != "http" or not scope["path"].startswith(self.settings.path_prefix):
+            return False
+        headers = Headers(scope=scope)
+        signature = headers.get(PROFILE_SIGNATURE_HEADER)
+        timestamp = headers.get(PROFILE_TIMESTAMP_HEADER)
+        if is_profile_signature_valid(self.settings, scope["method"], scope["path"], timestamp, signature):
+            return True
+        return random.random() < self.settings.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.settings.enabled or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        request_profiler = _RequestProfiler(self.settings)
+
+        async def run_app() -> None:
+            await self.app(scope, receive, request_profiler.wrap_send(send))
+
+        started_at = time.perf_counter()
+        request_profiler.start()
+        stop_timer = asyncio.get_running_loop().call_later(self.settings.max_duration, request_profiler.stop)
+        try:
+            await asyncio.create_task(run_app(), context=request_profiler.context)
+        finally:
+            stop_timer.cancel()
+            request_profiler.stop()
+            duration = time.perf_counter() - started_at
+            if not request_profiler.is_event_stream:
+                await self._save_profile(scope, request_profiler.profiler, duration)
+
+    async def _save_profile(self, scope: Scope, profiler: Profiler, duration: float) -> None:
+        state = scope["app"].state
+        profile_id = uuid4().hex
+        created_at = datetime.now(timezone.utc)
+        object_name = f"{self.settings.storage_prefix}{created_at:%Y%m%dT%H%M%S}-{profile_id}.speedscope.json"
+        try:
+            url = await state.storage_service.upload_file(
+                data=await asyncio.to_thread(profiler.output, SpeedscopeRenderer()),
+                object_name=object_name,
+                content_type="application/json",
+            )
+        except Exception:
+            logger.exception("Не удалось сохранить профиль запроса %s %s", scope["method"], scope["path"])
+            return
+
+        state.profile_registry.add(
+            ProfileRecord(
+                id=profile_id,
+                method=scope["method"],
+                path=scope["path"],
+                duration=duration,
+                url=url,
+                created_at=created_at,
+            ),
+        )
+        logger.info("Профиль запроса %s %s сохранён: %s", scope["method"], scope["path"], url)
@@ -0,0 +1,27 @@
+from collections.abc import Mapping
+from typing import Any
+
+from pydantic import TypeAdapter
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+
+class PydanticJSONResponse(Response):
+    """JSON-ответ, сериализованный заранее собранным TypeAdapter без повторной валидации."""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        adapter: TypeAdapter[Any],
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        super().__init__(
+            content=adapter.dump_json(content, by_alias=True),
+            status_code=status_code,
+            headers=headers,
+            background=background,
+        )
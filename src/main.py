@@ -4,14 +4,20 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from html_page_generator import AsyncDeepseekClient, AsyncUnsplashClient
 
 from .core.config import settings
 from .core.logs import setup_logging
+from .core.loop_monitor import LoopLagMonitor
+from .core.profiling import ProfileRegistry, ProfilingMiddleware
 from .frontend import create_frontend_app
+from .routers.admin import router as admin_router
 from .routers.frontend import router as frontend_router
+from .services.generation_policy import GenerationTracker
 from .services.gotenberg import create_gotenberg_client
 from .services.s3 import S3StorageService
+from .services.site_events import SiteEventBroker
 
 setup_logging(
     level=logging.DEBUG if settings.debug else logging.INFO,
@@ -24,6 +30,7 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     async with (
+        LoopLagMonitor(settings.loop_monitor) as loop_monitor,
         create_gotenberg_client(settings.gotenberg) as gotenberg_client,
         S3StorageService(settings.s3) as storage_service,
         AsyncUnsplashClient.setup(
@@ -35,15 +42,22 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             settings.deepseek.base_url,
             settings.deepseek.model,
         ),
+        GenerationTracker(settings.generation) as generation_tracker,
     ):
         app.state.gotenberg_client = gotenberg_client
         app.state.storage_service = storage_service
+        app.state.loop_monitor = loop_monitor
+        app.state.site_events = SiteEventBroker(settings.site_events)
+        app.state.generation_tracker = generation_tracker
+        app.state.profile_registry = ProfileRegistry(settings.profiling.max_recent)
         yield
 
 
-app = FastAPI(debug=settings.debug, lifespan=lifespan)
+app = FastAPI(debug=settings.debug, lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_middleware(ProfilingMiddleware, settings=settings.profiling)
 
 app.include_router(frontend_router, prefix="/frontend-api")
+app.include_router(admin_router, prefix="/admin-api")
 
 frontend_app = create_frontend_app()
 app.mount("/", frontend_app)
@@ -0,0 +1,15 @@
+"""Admin API routers."""
+
+from fastapi import APIRouter
+
+from .event_loop.routes import router as event_loop_router
+from .generations.routes import router as generations_router
+from .profiles.routes import router as profiles_router
+
+router = APIRouter()
+router.include_router(profiles_router)
+router.include_router(event_loop_router)
+router.include_router(generations_router)
+
+
+__all__ = ["router"]
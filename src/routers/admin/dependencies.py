@@ -0,0 +1,16 @@
+from fastapi import Header, HTTPException, Request, status
+
+from src.core.config import settings
+from src.core.profiling import PROFILE_SIGNATURE_HEADER, PROFILE_TIMESTAMP_HEADER, is_profile_signature_valid
+
+
+async def verify_admin_signature(
+    request: Request,
+    signature: str | None = Header(default=None, alias=PROFILE_SIGNATURE_HEADER),
+    timestamp: str | None = Header(default=None, alias=PROFILE_TIMESTAMP_HEADER),
+) -> None:
+    if not is_profile_signature_valid(settings.profiling, request.method, request.url.path, timestamp, signature):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid admin signature")
+
+
+__all__ = ["verify_admin_signature"]
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Request
+
+from .schemas import EventLoopLagResponse
+from ..dependencies import verify_admin_signature
+
+router = APIRouter(tags=["Event loop"])
+
+
+@router.get(
+    "/event-loop/lag",
+    summary="Получить задержку event loop",
+    description="Выдать текущую и максимальную задержку event loop процесса. Требует заголовок X-Profile-Signature.",
+    dependencies=[Depends(verify_admin_signature)],
+)
+async def get_event_loop_lag(request: Request) -> EventLoopLagResponse:
+    loop_monitor = request.app.state.loop_monitor
+    return EventLoopLagResponse(
+        lag=loop_monitor.lag,
+        smoothed_lag=loop_monitor.smoothed_lag,
+        max_lag=loop_monitor.max_lag,
+        is_overloaded=loop_monitor.is_overloaded,
+    )
+
+
+__all__ = ["router"]
@@ -0,0 +1,31 @@
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+
+class EventLoopLagResponse(BaseModel):
+    """Задержка event loop процесса"""
+
+    lag: float = Field(description="Последняя измеренная задержка в секундах")
+    smoothed_lag: float = Field(description="Экспоненциально сглаженная задержка в секундах")
+    max_lag: float = Field(description="Максимальная задержка с момента запуска в секундах")
+    is_overloaded: bool = Field(description="Отклоняются ли новые генерации из-за задержки")
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "is_overloaded": False,
+                    "lag": 0.002,
+                    "smoothed_lag": 0.004,
+                    "max_lag": 0.734,
+                },
+            ],
+        },
+    )
+
+
+__all__ = [
+    "EventLoopLagResponse",
+]
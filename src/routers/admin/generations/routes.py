@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Request
+
+from .schemas import GenerationStatsResponse
+from ..dependencies import verify_admin_signature
+
+router = APIRouter(tags=["Generations"])
+
+
+@router.get(
+    "/generations/stats",
+    summary="Получить счётчики генераций после отключения клиента",
+    description="Выдать, сколько генераций прервано и сколько доработало в фоне после отключения клиента. "
+    "Требует заголовок X-Profile-Signature.",
+    dependencies=[Depends(verify_admin_signature)],
+)
+async def get_generation_stats(request: Request) -> GenerationStatsResponse:
+    tracker = request.app.state.generation_tracker
+    return GenerationStatsResponse(
+        aborted_after_disconnect=tracker.aborted_after_disconnect,
+        completed_after_disconnect=tracker.completed_after_disconnect,
+        failed_after_disconnect=tracker.failed_after_disconnect,
+        in_background=tracker.in_background,
+    )
+
+
+__all__ = ["router"]
@@ -0,0 +1,31 @@
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+
+class GenerationStatsResponse(BaseModel):
+    """Счётчики генераций, от которых отключился клиент"""
+
+    aborted_after_disconnect: int = Field(description="Прервано после отключения клиента")
+    completed_after_disconnect: int = Field(description="Доработало в фоне после отключения клиента")
+    failed_after_disconnect: int = Field(description="Завершилось ошибкой в фоне после отключения клиента")
+    in_background: int = Field(description="Сейчас дорабатывает в фоне")
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "aborted_after_disconnect": 12,
+                    "completed_after_disconnect": 30,
+                    "failed_after_disconnect": 1,
+                    "in_background": 2,
+                },
+            ],
+        },
+    )
+
+
+__all__ = [
+    "GenerationStatsResponse",
+]
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends, Request
+
+from .schemas import ProfileResponse
+from ..dependencies import verify_admin_signature
+
+router = APIRouter(tags=["Profiles"])
+
+
+@router.get(
+    "/profiles",
+    summary="Получить список последних профилей",
+    description="Выдать список последних сохранённых профилей запросов. Требует заголовок X-Profile-Signature.",
+    dependencies=[Depends(verify_admin_signature)],
+)
+async def get_profiles(request: Request) -> dict[str, list[ProfileResponse]]:
+    records = request.app.state.profile_registry.list_recent()
+    return {
+        "profiles": [ProfileResponse.model_validate(record) for record in records],
+    }
+
+
+__all__ = ["router"]
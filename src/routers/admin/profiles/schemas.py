@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+
+class ProfileResponse(BaseModel):
+    """Информация о сохранённом профиле запроса"""
+
+    id: str = Field(description="ID профиля")
+    method: str = Field(description="HTTP-метод запроса")
+    path: str = Field(description="Путь запроса")
+    duration: float = Field(description="Длительность запроса в секундах")
+    url: str = Field(description="URL файла профиля в формате speedscope")
+    created_at: datetime = Field(description="Дата создания профиля")
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        from_attributes=True,
+        json_schema_extra={
+            "examples": [
+                {
+                    "created_at": datetime(2025, 6, 15, 18, 29, 56).isoformat(),
+                    "duration": 12.5,
+                    "id": "0f8c5a4e2b7d4c1e9a3b6d8f0e2c4a6b",
+                    "method": "POST",
+                    "path": "/frontend-api/sites/1/generate",
+                    "url": "http://example.com/profiles/20250615T182956-0f8c5a4e.speedscope.json",
+                },
+            ],
+        },
+    )
+
+
+__all__ = [
+    "ProfileResponse",
+]
@@ -8,6 +8,7 @@ from .sites.schemas import CreateSiteRequest, GeneratedSiteResponse, SiteRespons
 from .users.schemas import UserDetailsResponse
 
 MOCK_SITE_ID = 1
+MOCK_USER_ID = 1
 MOCK_TITLE = "Тестовый сайт"
 MOCK_PROMPT = "Тестовый промпт для сайта"
 MOCK_SITE_HTML_FILE_NAME = "mocked_site.html"
@@ -35,7 +36,7 @@ def get_mock_user_details_response() -> UserDetailsResponse:
     return UserDetailsResponse(
         email="example@example.com",
         is_active=True,
-        profile_id=1,
+        profile_id=MOCK_USER_ID,
         registered_at=datetime(2025, 6, 15, 18, 29, 56),
         updated_at=datetime(2025, 6, 15, 18, 29, 56),
         username="user123",
@@ -1,24 +1,38 @@
+import asyncio
 import logging
-from collections.abc import AsyncGenerator
+import time
+from collections.abc import AsyncGenerator, AsyncIterator
+from uuid import uuid4
 
-import anyio
-from fastapi import APIRouter, Request
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.responses import RedirectResponse, StreamingResponse
-from gotenberg_api import GotenbergServerError
 from html_page_generator import AsyncPageGenerator
 
 from src.core.config import settings
-from src.services.gotenberg import screenshot_html
+from src.core.responses import PydanticJSONResponse
+from src.services.generation_buffer import GenerationBuffer
+from src.services.generation_policy import DisconnectAction
+from src.services.gotenberg import screenshot_html_file
+from src.services.site_events import SiteEventPublisher, SiteEventStage
 
 from .schemas import (
+    GENERATED_SITE_ADAPTER,
+    SITE_ADAPTER,
+    SITE_LIST_ADAPTER,
     CreateSiteRequest,
     GeneratedSiteResponse,
+    SiteBatchGenerateRequest,
+    SiteBatchItemResult,
+    SiteBatchItemStatus,
     SiteGenerateRequest,
+    SiteListResponse,
     SiteResponse,
 )
 from ..mocks import (
     MOCK_SITE_HTML_FILE_NAME,
     MOCK_SITE_SCREENSHOT_FILE_NAME,
+    MOCK_USER_ID,
     get_mock_generated_site_response,
     get_mock_site_html_file_url,
     get_mock_site_response,
@@ -36,77 +50,250 @@ router = APIRouter(tags=["Sites"])
     summary="Создать сайт",
     description="Создает сайт для текущего пользователя.",
 )
-async def create_site(request: CreateSiteRequest) -> GeneratedSiteResponse:
-    return get_mock_generated_site_response(request)
+async def create_site(request: CreateSiteRequest) -> PydanticJSONResponse:
+    return PydanticJSONResponse(get_mock_generated_site_response(request), GENERATED_SITE_ADAPTER)
+
+
+async def _upload_html(request: Request, buffer: GenerationBuffer, object_name: str) -> str:
+    storage_service = request.app.state.storage_service
+    return await storage_service.upload_file(
+        data=buffer.rewind(),
+        object_name=object_name,
+        content_type="text/html",
+        content_disposition="inline",
+    )
+
+
+async def _upload_screenshot(request: Request, buffer: GenerationBuffer, object_name: str) -> str:
+    screenshot_bytes = await screenshot_html_file(
+        client=request.app.state.gotenberg_client,
+        settings=settings.gotenberg,
+        html_file=buffer.rewind(),
+    )
+    storage_service = request.app.state.storage_service
+    return await storage_service.upload_file(
+        data=screenshot_bytes,
+        object_name=object_name,
+        content_type="image/png",
+    )
+
+
+class _GenerationStream:
+    """Ограниченная очередь чанков HTML между задачей генерации и ответом клиенту."""
+
+    def __init__(self, buffer: GenerationBuffer) -> None:
+        self.buffer = buffer
+        self._chunks: asyncio.Queue[str | None] = asyncio.Queue(maxsize=settings.generation.stream_queue_size)
+        self._is_detached = False
+
+    async def send(self, chunk: str) -> None:
+        self.buffer.write(chunk)
+        if not self._is_detached:
+            await self._chunks.put(chunk)
+
+    async def finish(self) -> None:
+        if not self._is_detached:
+            await self._chunks.put(None)
+
+    def detach(self) -> None:
+        self._is_detached = True
+        while not self._chunks.empty():
+            self._chunks.get_nowait()
+
+    async def iter_chunks(self) -> AsyncIterator[str]:
+        while (chunk := await self._chunks.get()) is not None:
+            yield chunk
+
+
+async def _generate_and_upload(
+    site_generator: AsyncPageGenerator,
+    payload: SiteGenerateRequest,
+    request: Request,
+    events: SiteEventPublisher,
+    stream: _GenerationStream,
+) -> None:
+    with stream.buffer as buffer:
+        events.publish(SiteEventStage.GENERATION_STARTED)
+        try:
+            try:
+                async for html_chunk in site_generator(payload.prompt):
+                    await stream.send(html_chunk)
+            finally:
+                await stream.finish()
+
+            html_url = await _upload_html(request, buffer, MOCK_SITE_HTML_FILE_NAME)
+        except Exception as e:
+            events.publish(SiteEventStage.FAILED, detail=str(e))
+            raise
+        events.publish(SiteEventStage.HTML_STORED, url=html_url)
+
+        try:
+            screenshot_url = await _upload_screenshot(request, buffer, MOCK_SITE_SCREENSHOT_FILE_NAME)
+        except httpx.HTTPError as e:
+            logger.error(e)
+            events.publish(SiteEventStage.FAILED, detail=str(e))
+        else:
+            events.publish(SiteEventStage.SCREENSHOT_STORED, url=screenshot_url)
 
 
 async def _stream_and_upload(
     site_generator: AsyncPageGenerator,
     payload: SiteGenerateRequest,
     request: Request,
+    events: SiteEventPublisher,
 ) -> AsyncGenerator:
-    with anyio.CancelScope(shield=True):
-        async for html_chunk in site_generator(payload.prompt):
+    stream = _GenerationStream(GenerationBuffer(settings.generation))
+    task = asyncio.create_task(_generate_and_upload(site_generator, payload, request, events, stream))
+    tracker = request.app.state.generation_tracker
+    is_streamed = False
+    try:
+        async for html_chunk in stream.iter_chunks():
             yield html_chunk
+        is_streamed = True
+        await asyncio.shield(task)
+    finally:
+        if not task.done():
+            stream.detach()
+            action = DisconnectAction.DETACH
+            if not is_streamed:
+                action = tracker.choose_action(stream.buffer.size, payload.persist_on_disconnect)
+            if action == DisconnectAction.ABORT:
+                tracker.abort(task)
+                events.publish(SiteEventStage.FAILED, detail="Generation aborted after client disconnect")
+            else:
+                tracker.detach(task)
 
-        html_code = site_generator.html_page.html_code
-        storage_service = request.app.state.storage_service
-        await storage_service.upload_file(
-            data=html_code.encode("utf-8"),
-            object_name=MOCK_SITE_HTML_FILE_NAME,
-            content_type="text/html",
-            content_disposition="inline",
-        )
 
+async def _generate_batch_item(
+    index: int,
+    prompt: str,
+    batch_id: str,
+    request: Request,
+    semaphore: asyncio.Semaphore,
+) -> SiteBatchItemResult:
+    async with semaphore:
+        started_at = time.monotonic()
+        result = SiteBatchItemResult(index=index, prompt=prompt, status=SiteBatchItemStatus.FAILED)
+        object_prefix = f"batches/{batch_id}/{index}"
         try:
-            gotenberg_client = request.app.state.gotenberg_client
-            screenshot_bytes = await screenshot_html(
-                client=gotenberg_client,
-                settings=settings.gotenberg,
-                html_code=html_code,
-            )
-        except GotenbergServerError as e:
-            logger.error(e)
-        else:
-            await storage_service.upload_file(
-                data=screenshot_bytes,
-                object_name=MOCK_SITE_SCREENSHOT_FILE_NAME,
-                content_type="image/png",
-            )
+            with GenerationBuffer(settings.generation) as buffer:
+                site_generator = AsyncPageGenerator(debug_mode=settings.debug)
+                async for html_chunk in site_generator(prompt):
+                    buffer.write(html_chunk)
+
+                result.html_code_url = await _upload_html(request, buffer, f"{object_prefix}/index.html")
+                result.status = SiteBatchItemStatus.COMPLETED
+                try:
+                    result.screenshot_url = await _upload_screenshot(request, buffer, f"{object_prefix}/index.png")
+                except httpx.HTTPError as e:
+                    logger.error("Не удалось сделать скриншот сайта %s в пакете %s: %s", index, batch_id, e)
+                    result.error = str(e)
+        except Exception as e:
+            logger.exception("Ошибка генерации сайта %s в пакете %s", index, batch_id)
+            result.error = str(e)
+        result.elapsed = time.monotonic() - started_at
+        return result
+
+
+async def _generate_batch(prompts: list[str], request: Request) -> AsyncGenerator:
+    batch_id = uuid4().hex
+    semaphore = asyncio.Semaphore(settings.generation.batch_concurrency)
+    tasks = [
+        asyncio.create_task(_generate_batch_item(index, prompt, batch_id, request, semaphore))
+        for index, prompt in enumerate(prompts)
+    ]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            result = await next_result
+            yield result.model_dump_json(by_alias=True) + "\n"
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def reject_if_loop_overloaded(request: Request) -> None:
+    if request.app.state.loop_monitor.is_overloaded:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is overloaded, try again later",
+            headers={"Retry-After": "1"},
+        )
 
 
 @router.post(
     "/sites/{site_id}/generate",
     summary="Сгенерировать сайт",
     description="Сгенерировать сайт по ID. Стримит HTML и параллельно пишет в index.html",
+    dependencies=[Depends(reject_if_loop_overloaded)],
 )
 async def generate_site(site_id: int, payload: SiteGenerateRequest, req: Request) -> StreamingResponse:
     site_generator = AsyncPageGenerator(
         debug_mode=settings.debug,
     )
-    return StreamingResponse(content=_stream_and_upload(site_generator, payload, req), media_type="text/html")
+    events = SiteEventPublisher(req.app.state.site_events, site_id=site_id, user_id=MOCK_USER_ID)
+    return StreamingResponse(
+        content=_stream_and_upload(site_generator, payload, req, events),
+        media_type="text/html",
+    )
+
+
+@router.post(
+    "/sites/generate-batch",
+    summary="Сгенерировать пакет сайтов",
+    description=(
+        "Сгенерировать сайты по списку промптов с ограничением параллельности. "
+        "Стримит результаты в формате NDJSON по мере готовности, порядок строк не совпадает с порядком промптов."
+    ),
+    dependencies=[Depends(reject_if_loop_overloaded)],
+)
+async def generate_sites_batch(payload: SiteBatchGenerateRequest, req: Request) -> StreamingResponse:
+    if len(payload.prompts) > settings.generation.batch_max_size:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Batch size must not exceed {settings.generation.batch_max_size} prompts",
+        )
+    return StreamingResponse(
+        content=_generate_batch(payload.prompts, req),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/sites/{site_id}/events",
+    summary="Подписаться на события генерации сайта",
+    description="Server-sent events о ходе генерации сайта: старт генерации, сохранение HTML и скриншота, ошибки.",
+)
+async def get_site_events(site_id: int, req: Request) -> StreamingResponse:
+    return StreamingResponse(
+        content=req.app.state.site_events.stream(site_id=site_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get(
     "/sites/my",
+    response_model=SiteListResponse,
     summary="Получить список сайтов текущего пользователя",
     description="Выдать список сайтов текущего пользователя",
 )
-async def get_sites_my() -> dict[str, list[SiteResponse]]:
-    return {
+async def get_sites_my() -> PydanticJSONResponse:
+    sites = {
         "sites": [
             get_mock_site_response(),
         ],
     }
+    return PydanticJSONResponse(sites, SITE_LIST_ADAPTER)
 
 
 @router.get(
     "/sites/{site_id}",
+    response_model=SiteResponse,
     summary="Получить сайт",
     description="Получить сайт по ID.",
 )
-async def get_site(site_id: int) -> SiteResponse:
-    return get_mock_site_response()
+async def get_site(site_id: int) -> PydanticJSONResponse:
+    return PydanticJSONResponse(get_mock_site_response(), SITE_ADAPTER)
 
 
 @router.get(
@@ -1,6 +1,7 @@
 from datetime import datetime
+from enum import Enum
 
-from pydantic import BaseModel, ConfigDict, Field, HttpUrl, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, PositiveInt, TypeAdapter
 from pydantic.alias_generators import to_camel
 
 
@@ -64,6 +65,10 @@ class SiteGenerateRequest(BaseModel):
     """Запрос на генерацию сайта"""
 
     prompt: str = Field(description="Prompt для создания сайта")
+    persist_on_disconnect: bool = Field(
+        default=True,
+        description="Догенерировать и сохранить сайт в фоне, если клиент отключится до конца стрима",
+    )
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -76,9 +81,61 @@ class SiteGenerateRequest(BaseModel):
     )
 
 
+class SiteBatchGenerateRequest(BaseModel):
+    """Запрос на пакетную генерацию сайтов"""
+
+    prompts: list[str] = Field(min_length=1, description="Промпты для создания сайтов")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "examples": [
+                {
+                    "prompts": ["Сайт о стегозаврах", "Сайт любителей играть в домино"],
+                },
+            ],
+        },
+    )
+
+
+class SiteBatchItemStatus(str, Enum):
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class SiteBatchItemResult(BaseModel):
+    """Результат генерации одного сайта из пакета"""
+
+    index: int = Field(description="Номер промпта в запросе")
+    prompt: str = Field(description="Prompt для создания сайта")
+    status: SiteBatchItemStatus = Field(description="Статус генерации")
+    html_code_url: str | None = Field(default=None, description="URL HTML кода сайта")
+    screenshot_url: str | None = Field(default=None, description="URL скриншота сайта")
+    error: str | None = Field(default=None, description="Описание ошибки, если генерация или скриншот не удались")
+    elapsed: float = Field(default=0, description="Длительность генерации в секундах")
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+
+SiteListResponse = dict[str, list[SiteResponse]]
+
+SITE_ADAPTER = TypeAdapter(SiteResponse)
+GENERATED_SITE_ADAPTER = TypeAdapter(GeneratedSiteResponse)
+SITE_LIST_ADAPTER = TypeAdapter(SiteListResponse)
+
+
 __all__ = [
     "CreateSiteRequest",
     "SiteResponse",
     "GeneratedSiteResponse",
     "SiteGenerateRequest",
+    "SiteBatchGenerateRequest",
+    "SiteBatchItemStatus",
+    "SiteBatchItemResult",
+    "SiteListResponse",
+    "SITE_ADAPTER",
+    "GENERATED_SITE_ADAPTER",
+    "SITE_LIST_ADAPTER",
 ]
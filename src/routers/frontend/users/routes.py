@@ -1,7 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
 
-from .schemas import UserDetailsResponse
-from ..mocks import get_mock_user_details_response
+from src.core.responses import PydanticJSONResponse
+
+from .schemas import USER_DETAILS_ADAPTER, UserDetailsResponse
+from ..mocks import MOCK_USER_ID, get_mock_user_details_response
 
 router = APIRouter(tags=["Users"])
 
@@ -12,8 +15,21 @@ router = APIRouter(tags=["Users"])
     summary="Получить информацию о текущем пользователе",
     description="Возвращает данные профиля текущего авторизованного пользователя.",
 )
-async def me() -> UserDetailsResponse:
-    return get_mock_user_details_response()
+async def me() -> PydanticJSONResponse:
+    return PydanticJSONResponse(get_mock_user_details_response(), USER_DETAILS_ADAPTER)
+
+
+@router.get(
+    "/users/me/events",
+    summary="Подписаться на события генерации сайтов текущего пользователя",
+    description="Server-sent events о ходе генерации всех сайтов текущего пользователя.",
+)
+async def get_my_events(req: Request) -> StreamingResponse:
+    return StreamingResponse(
+        content=req.app.state.site_events.stream(user_id=MOCK_USER_ID),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 __all__ = ["router"]
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, PositiveInt
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, PositiveInt, TypeAdapter
 from pydantic.alias_generators import to_camel
 
 UserName = Annotated[
@@ -41,7 +41,11 @@ class UserDetailsResponse(BaseModel):
     )
 
 
+USER_DETAILS_ADAPTER = TypeAdapter(UserDetailsResponse)
+
+
 __all__ = [
     "UserName",
     "UserDetailsResponse",
+    "USER_DETAILS_ADAPTER",
 ]
@@ -0,0 +1,60 @@
+import io
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO
+
+from ..core.config import GenerationSettings
+
+
+class _SpooledFileReader(io.RawIOBase):
+    """Читатель SpooledTemporaryFile без fileno(), чтобы чтение не сбрасывало буфер на диск."""
+
+    def __init__(self, file: SpooledTemporaryFile[bytes]) -> None:
+        super().__init__()
+        self._file = file
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        return self._file.readinto(buffer)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+
+class GenerationBuffer:
+    """Буфер сгенерированного HTML, который при превышении порога сбрасывается на диск."""
+
+    def __init__(self, settings: GenerationSettings) -> None:
+        self._file: SpooledTemporaryFile[bytes] = SpooledTemporaryFile(max_size=settings.buffer_max_memory_size)
+        self._size = 0
+
+    def __enter__(self) -> "GenerationBuffer":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    @property
+    def size(self) -> int:
+        """Размер накопленных данных в байтах."""
+        return self._size
+
+    def write(self, chunk: str) -> None:
+        data = chunk.encode("utf-8")
+        self._file.write(data)
+        self._size += len(data)
+
+    def rewind(self) -> BinaryIO:
+        """Вернуть поток для чтения накопленных данных с начала."""
+        self._file.seek(0)
+        return io.BufferedReader(_SpooledFileReader(self._file))
+
+    def close(self) -> None:
+        self._file.close()
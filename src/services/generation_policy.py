@@ -0,0 +1,66 @@
+import asyncio
+import logging
+from enum import Enum
+from typing import Any
+
+from ..core.config import GenerationSettings
+
+logger = logging.getLogger(__name__)
+
+
+class DisconnectAction(str, Enum):
+    ABORT = "abort"
+    DETACH = "detach"
+
+
+class GenerationTracker:
+    """Политика обработки генераций, от которых отключился клиент, и счётчики по ним."""
+
+    def __init__(self, settings: GenerationSettings) -> None:
+        self.settings = settings
+        self.aborted_after_disconnect = 0
+        self.completed_after_disconnect = 0
+        self.failed_after_disconnect = 0
+        self._detached: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "GenerationTracker":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if not self._detached:
+            return
+        logger.info("Ожидание %s генераций, дорабатывающих в фоне", len(self._detached))
+        _, pending = await asyncio.wait(self._detached, timeout=self.settings.shutdown_timeout)
+        if pending:
+            logger.warning("%s генераций не успели завершиться до остановки и будут прерваны", len(pending))
+            for task in pending:
+                task.cancel()
+            await asyncio.wait(pending)
+
+    @property
+    def in_background(self) -> int:
+        """Сколько генераций сейчас дорабатывает в фоне после отключения клиента."""
+        return len(self._detached)
+
+    def choose_action(self, generated_bytes: int, persist: bool) -> DisconnectAction:
+        if persist and generated_bytes >= self.settings.disconnect_abort_threshold:
+            return DisconnectAction.DETACH
+        return DisconnectAction.ABORT
+
+    def abort(self, task: asyncio.Task) -> None:
+        task.cancel()
+        self.aborted_after_disconnect += 1
+
+    def detach(self, task: asyncio.Task) -> None:
+        self._detached.add(task)
+        task.add_done_callback(self._on_detached_done)
+
+    def _on_detached_done(self, task: asyncio.Task) -> None:
+        self._detached.discard(task)
+        if task.cancelled():
+            self.failed_after_disconnect += 1
+        elif exc := task.exception():
+            self.failed_after_disconnect += 1
+            logger.error("Ошибка генерации после отключения клиента: %s", exc)
+        else:
+            self.completed_after_disconnect += 1
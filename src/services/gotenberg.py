@@ -1,9 +1,8 @@
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import Literal, Optional
+from typing import IO, Literal, Optional
 
 import httpx
-from gotenberg_api import ScreenshotHTMLRequest
 from httpx import Limits
 
 from ..core.config import GotenbergSettings
@@ -22,17 +21,23 @@ async def create_gotenberg_client(settings: GotenbergSettings) -> AsyncIterator[
         await client.aclose()
 
 
-async def screenshot_html(
+async def screenshot_html_file(
     client: httpx.AsyncClient,
     settings: GotenbergSettings,
-    html_code: str,
+    html_file: IO[bytes],
     width: Optional[int] = None,
     screenshot_format: Optional[Literal["png", "jpeg", "webp"]] = None,
     wait_delay: Optional[int] = None,
 ) -> bytes:
-    return await ScreenshotHTMLRequest(
-        index_html=html_code,
-        width=width or settings.screenshot_width,
-        format=screenshot_format or settings.screenshot_format.value,
-        wait_delay=wait_delay or settings.wait_delay,
-    ).asend(client)
+    """Сделать скриншот HTML, читая его из файла по частям."""
+    response = await client.post(
+        "/forms/chromium/screenshot/html",
+        files={"files": ("index.html", html_file, "text/html")},
+        data={
+            "width": str(width or settings.screenshot_width),
+            "format": screenshot_format or settings.screenshot_format.value,
+            "waitDelay": f"{wait_delay or settings.wait_delay}s",
+        },
+    )
+    response.raise_for_status()
+    return response.content
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from contextlib import AsyncExitStack
 from pathlib import Path
-from typing import Any, BinaryIO
+from typing import IO, Any
 
 import aiofiles
 import furl
@@ -9,6 +9,8 @@ from aioboto3.session import AioConfig, Session
 
 from ..core.config import S3Settings
 
+FILE_CHUNK_SIZE = 64 * 1024
+
 
 class StorageService(ABC):
     """Абстрактный класс для сервиса хранилища файлов."""
@@ -24,7 +26,7 @@ class StorageService(ABC):
     @abstractmethod
     async def upload_file(
         self,
-        data: bytes | str | BinaryIO,
+        data: bytes | str | IO[bytes],
         object_name: str,
         content_type: str = "application/octet-stream",
         content_disposition: str | None = None,
@@ -71,7 +73,7 @@ class S3StorageService(StorageService):
 
     async def upload_file(
         self,
-        data: bytes | str | BinaryIO,
+        data: bytes | str | IO[bytes],
         object_name: str,
         content_type: str = "application/octet-stream",
         content_disposition: str | None = None,
@@ -121,7 +123,7 @@ class FileSystemStorageService(StorageService):
 
     async def upload_file(
         self,
-        data: bytes | str | BinaryIO,
+        data: bytes | str | IO[bytes],
         object_name: str,
         content_type: str = "application/octet-stream",
         content_disposition: str | None = None,
@@ -136,7 +138,8 @@ class FileSystemStorageService(StorageService):
             if isinstance(data, bytes):
                 await f.write(data)
             else:
-                await f.write(data.read())
+                while chunk := data.read(FILE_CHUNK_SIZE):
+                    await f.write(chunk)
 
         return str(file_path)
 
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+from ..core.config import SiteEventsSettings
+
+logger = logging.getLogger(__name__)
+
+
+class SiteEventStage(str, Enum):
+    GENERATION_STARTED = "generation_started"
+    HTML_STORED = "html_stored"
+    SCREENSHOT_STORED = "screenshot_stored"
+    FAILED = "failed"
+
+
+class SiteEvent(BaseModel):
+    """Событие о ходе генерации сайта"""
+
+    stage: SiteEventStage = Field(description="Этап генерации")
+    site_id: int = Field(description="ID сайта")
+    user_id: int = Field(description="ID пользователя")
+    elapsed: float = Field(description="Секунд с начала генерации")
+    url: str | None = Field(default=None, description="URL сохранённого файла")
+    detail: str | None = Field(default=None, description="Описание ошибки")
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        description="Дата события",
+    )
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+
+class SiteEventBroker:
+    """Внутрипроцессный pub/sub событий генерации сайтов."""
+
+    def __init__(self, settings: SiteEventsSettings) -> None:
+        self.settings = settings
+        self._subscribers: set[tuple[int | None, int | None, asyncio.Queue[SiteEvent]]] = set()
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        site_id: int | None = None,
+        user_id: int | None = None,
+    ) -> AsyncIterator[asyncio.Queue[SiteEvent]]:
+        queue: asyncio.Queue[SiteEvent] = asyncio.Queue(maxsize=self.settings.queue_size)
+        subscriber = (site_id, user_id, queue)
+        self._subscribers.add(subscriber)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(subscriber)
+
+    async def stream(self, site_id: int | None = None, user_id: int | None = None) -> AsyncIterator[str]:
+        """Отдавать события подписки в формате server-sent events."""
+        async with self.subscribe(site_id=site_id, user_id=user_id) as queue:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=self.settings.keepalive_interval)
+                except TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield f"event: {event.stage.value}\ndata: {event.model_dump_json(by_alias=True)}\n\n"
+
+    def publish(self, event: SiteEvent) -> None:
+        for site_id, user_id, queue in self._subscribers:
+            if site_id is not None and site_id != event.site_id:
+                continue
+            if user_id is not None and user_id != event.user_id:
+                continue
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                logger.warning("Очередь подписчика событий сайта %s переполнена, событие отброшено", event.site_id)
+
+
+class SiteEventPublisher:
+    """Публикует события одной генерации, считая время от её начала."""
+
+    def __init__(self, broker: SiteEventBroker, site_id: int, user_id: int) -> None:
+        self.broker = broker
+        self.site_id = site_id
+        self.user_id = user_id
+        self._started_at = time.monotonic()
+
+    def publish(self, stage: SiteEventStage, url: str | None = None, detail: str | None = None) -> None:
+        self.broker.publish(
+            SiteEvent(
+                stage=stage,
+                site_id=self.site_id,
+                user_id=self.user_id,
+                elapsed=time.monotonic() - self._started_at,
+                url=url,
+                detail=detail,
+            ),
+        )